@@ -16,6 +16,7 @@ Usage:
     )
 """
 
+import io
 import json
 import logging
 import os
@@ -53,6 +54,9 @@ class AudioTimeline:
         self.min_speech_duration_ms = min_speech_duration_ms
         self.vad_threshold = vad_threshold
 
+        # Reuse one connection for all chunk VAD requests
+        self.session = requests.Session()
+
     def detect_speech_in_chunk(self, audio_chunk: bytes) -> List[Dict]:
         """
         Detect speech segments in audio chunk using m4t VAD API
@@ -64,7 +68,7 @@ class AudioTimeline:
             List of speech segments with start, end, duration
         """
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.m4t_api_url}/v1/detect-voice",
                 files={"audio": ("chunk.wav", audio_chunk, "audio/wav")},
                 data={
@@ -108,7 +112,6 @@ class AudioTimeline:
         chunk_array = audio_array[start_sample:end_sample]
 
         # Convert to WAV bytes
-        import io
         buffer = io.BytesIO()
         sf.write(buffer, chunk_array, sample_rate, format='WAV')
         buffer.seek(0)
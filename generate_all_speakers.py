@@ -42,6 +42,10 @@ class Colors:
     BOLD = '\033[1m'
 
 
+# Shared HTTP session: reuses the connection across all speaker requests
+_SESSION = requests.Session()
+
+
 def print_header(text):
     """Print formatted header"""
     print(f"\n{Colors.HEADER}{Colors.BOLD}{text}{Colors.END}")
@@ -70,7 +74,7 @@ def print_warning(text):
 def check_m4t_server(api_url: str) -> bool:
     """Check if m4t server is running"""
     try:
-        response = requests.get(f"{api_url}/health", timeout=5)
+        response = _SESSION.get(f"{api_url}/health", timeout=5)
         if response.status_code == 200:
             return True
         else:
@@ -109,7 +113,7 @@ def generate_speaker_audio(
     """
     try:
         # Call TTS API
-        response = requests.post(
+        response = _SESSION.post(
             f"{api_url}/v1/text-to-speech",
             json={
                 "text": text,
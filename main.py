@@ -8,21 +8,70 @@ Usage:
 """
 
 import argparse
+import io
+import json
+import random
+import re
 import sys
 import os
 import requests
 import subprocess
 import tempfile
 import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
+import soundfile as sf
 from dotenv import load_dotenv
 from tqdm import tqdm
 
+# Prefer SIMD-accelerated base64 decoding (pip install pybase64), fall back to stdlib
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+# Prefer faster JSON decoding for large base64-laden API responses
+# (pip install orjson), fall back to stdlib
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# Retry transient failures briefly: connection errors for any request (nothing
+# was sent yet), gateway errors and read failures only for GETs (health check)
+_RETRY = Retry(
+    total=2,
+    backoff_factor=0.25,
+    status_forcelist=[502, 503, 504],
+    allowed_methods=frozenset(['GET']),
+    raise_on_status=False
+)
+
+# Shared HTTP session: keeps connections to the m4t server alive across
+# per-fragment requests instead of opening a new TCP connection each time
+_SESSION = requests.Session()
+
+# Default connection pool size; grown by configure_session_pool() for larger --workers
+DEFAULT_POOL_MAXSIZE = 32
+
+
+def configure_session_pool(pool_maxsize=DEFAULT_POOL_MAXSIZE):
+    """Mount pooled adapters on the shared session, keeping up to pool_maxsize connections per host"""
+    _SESSION.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize, max_retries=_RETRY))
+    _SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize, max_retries=_RETRY))
+
+
+configure_session_pool()
+
 # Import audio timeline segmentation
 from audio_timeline import segment_with_timeline
 
 # Import SRT utilities
-from srt_utils import generate_srt_content, save_srt_file, parse_srt_file, extract_bilingual_text
+from srt_utils import generate_srt_to_file, parse_srt_file, extract_bilingual_text
 
 
 class Colors:
@@ -77,7 +126,9 @@ def check_file_exists(file_path):
 def check_m4t_server(api_url):
     """Check if m4t API server is accessible"""
     try:
-        response = requests.get(f"{api_url}/health", timeout=5)
+        # Separate connect/read timeouts: an unreachable server fails fast,
+        # a busy one still gets time to answer
+        response = _SESSION.get(f"{api_url}/health", timeout=(1.0, 4.0))
         if response.status_code == 200:
             print_success(f"m4t API server is accessible at {api_url}")
             return True
@@ -98,18 +149,13 @@ def check_m4t_server(api_url):
 
 def parse_language_pair(lang_pair):
     """Parse language pair string like 'eng:cmn' into (source, target)"""
-    if ':' not in lang_pair:
-        print_error(f"Invalid language pair format: '{lang_pair}'")
-        print_info("Expected format: 'source:target' (e.g., 'eng:cmn', 'jpn:eng')")
-        return None, None
-
-    parts = lang_pair.split(':')
-    if len(parts) != 2:
+    source_lang, sep, target_lang = lang_pair.partition(':')
+    if not sep or ':' in target_lang:
         print_error(f"Invalid language pair format: '{lang_pair}'")
         print_info("Expected format: 'source:target' (e.g., 'eng:cmn', 'jpn:eng')")
         return None, None
 
-    source_lang, target_lang = parts[0].strip(), parts[1].strip()
+    source_lang, target_lang = source_lang.strip(), target_lang.strip()
 
     if not source_lang or not target_lang:
         print_error(f"Invalid language pair format: '{lang_pair}'")
@@ -128,7 +174,6 @@ def infer_language_from_srt_filename(srt_path):
     Returns:
         Tuple of (source_lang, target_lang) or (None, None) if not found
     """
-    import re
     filename = Path(srt_path).stem
 
     # Pattern: filename.source-target (e.g., video.eng-cmn)
@@ -212,7 +257,7 @@ def speech_to_text_translation(audio_path, source_lang, target_lang, api_url, ve
         }
 
         # Call m4t S2TT API
-        response = requests.post(
+        response = _SESSION.post(
             f"{api_url}/v1/speech-to-text-translation",
             files=files,
             data=data,
@@ -220,7 +265,7 @@ def speech_to_text_translation(audio_path, source_lang, target_lang, api_url, ve
         )
 
         if response.status_code == 200:
-            result = response.json()
+            result = json_loads(response.content)
             return result
         else:
             print_error(f"API error: {response.status_code}")
@@ -259,7 +304,7 @@ def speech_to_speech_translation(audio_path, source_lang, target_lang, api_url,
         }
 
         # Call m4t S2ST API
-        response = requests.post(
+        response = _SESSION.post(
             f"{api_url}/v1/speech-to-speech-translation",
             files=files,
             data=data,
@@ -267,7 +312,7 @@ def speech_to_speech_translation(audio_path, source_lang, target_lang, api_url,
         )
 
         if response.status_code == 200:
-            result = response.json()
+            result = json_loads(response.content)
             return result
         else:
             print_error(f"API error: {response.status_code}")
@@ -285,9 +330,6 @@ def speech_to_speech_translation(audio_path, source_lang, target_lang, api_url,
 def save_audio_to_file(audio_data, sample_rate, output_path):
     """Save audio array to WAV file"""
     try:
-        import numpy as np
-        import soundfile as sf
-
         # Convert list to numpy array
         audio_array = np.array(audio_data, dtype=np.float32)
 
@@ -296,10 +338,6 @@ def save_audio_to_file(audio_data, sample_rate, output_path):
         print_success(f"Audio saved to: {output_path}")
         return True
 
-    except ImportError as e:
-        print_error(f"Missing required library: {e}")
-        print_info("Please install: pip install numpy soundfile")
-        return False
     except Exception as e:
         print_error(f"Error saving audio file: {e}")
         return False
@@ -308,8 +346,6 @@ def save_audio_to_file(audio_data, sample_rate, output_path):
 def save_base64_audio_to_file(audio_base64, output_path):
     """Decode base64 audio and save to WAV file"""
     try:
-        import base64
-
         # Decode base64 audio
         audio_bytes = base64.b64decode(audio_base64)
 
@@ -325,7 +361,11 @@ def save_base64_audio_to_file(audio_base64, output_path):
         return False
 
 
-def audio_split(audio_path, api_url, verbose=True, max_chunk_duration=300.0):
+# Number of long-audio chunks sent to the audio-split API concurrently
+AUDIO_SPLIT_WORKERS = 4
+
+
+def audio_split(audio_path, api_url, verbose=True, max_chunk_duration=300.0, max_workers=AUDIO_SPLIT_WORKERS):
     """
     Call m4t API for audio splitting (vocals + accompaniment)
 
@@ -336,16 +376,16 @@ def audio_split(audio_path, api_url, verbose=True, max_chunk_duration=300.0):
         api_url: m4t API server URL
         verbose: Print info messages
         max_chunk_duration: Maximum chunk duration in seconds (default: 300s = 5 minutes)
+        max_workers: Number of chunks processed concurrently for long audio
 
     Returns:
         Tuple of (vocals_bytes, accompaniment_bytes, sample_rate) or (None, None, None) on error
     """
     try:
-        import soundfile as sf
-
-        # Load audio to check duration
-        audio_array, sr = sf.read(audio_path, dtype='float32')
-        total_duration = len(audio_array) / sr
+        # Read the header only to check duration; audio is decoded per chunk later
+        info = sf.info(audio_path)
+        sr = info.samplerate
+        total_duration = info.frames / sr
 
         if verbose:
             print_info(f"Audio duration: {total_duration:.2f}s")
@@ -358,7 +398,7 @@ def audio_split(audio_path, api_url, verbose=True, max_chunk_duration=300.0):
         if verbose:
             print_info(f"Audio exceeds {max_chunk_duration}s, processing in chunks...")
 
-        return _audio_split_chunked(audio_array, sr, api_url, max_chunk_duration, verbose)
+        return _audio_split_chunked(audio_path, info.frames, sr, api_url, max_chunk_duration, verbose, max_workers)
 
     except Exception as e:
         print_error(f"Error in audio split: {e}")
@@ -383,17 +423,16 @@ def _audio_split_direct(audio_path, api_url, verbose=True):
         }
 
         # Call m4t audio-split API
-        response = requests.post(
+        response = _SESSION.post(
             f"{api_url}/v1/audio-split",
             files=files,
             timeout=300  # 5 minutes timeout
         )
 
         if response.status_code == 200:
-            result = response.json()
+            result = json_loads(response.content)
 
             # Decode base64 audio streams
-            import base64
             vocals_base64 = result.get('vocals_audio_base64', '')
             accompaniment_base64 = result.get('accompaniment_audio_base64', '')
             sample_rate = result.get('sample_rate', 16000)
@@ -418,40 +457,37 @@ def _audio_split_direct(audio_path, api_url, verbose=True):
         return None, None, None
 
 
-def _audio_split_chunked(audio_array, sr, api_url, chunk_duration, verbose=True):
+def _audio_split_chunked(audio_path, total_samples, sr, api_url, chunk_duration, verbose=True, max_workers=AUDIO_SPLIT_WORKERS):
     """
     Split long audio into chunks, process each chunk via API, then concatenate results
 
+    Each chunk is read from disk on demand, so the full input is never decoded
+    into memory at once.
+
     Args:
-        audio_array: Full audio array
+        audio_path: Path to audio file
+        total_samples: Total number of samples (frames) in the file
         sr: Sample rate
         api_url: m4t API server URL
         chunk_duration: Duration of each chunk in seconds
         verbose: Print info messages
+        max_workers: Number of chunks sent to the API concurrently
 
     Returns:
         Tuple of (vocals_bytes, accompaniment_bytes, sample_rate)
     """
-    import soundfile as sf
-    import base64
-    import io
-    import numpy as np
-
-    total_duration = len(audio_array) / sr
+    total_duration = total_samples / sr
     chunk_samples = int(chunk_duration * sr)
     num_chunks = int(np.ceil(total_duration / chunk_duration))
 
     if verbose:
         print_info(f"Processing {num_chunks} chunks of {chunk_duration}s each...")
 
-    vocals_chunks = []
-    accompaniment_chunks = []
-    result_sr = 16000  # Default sample rate
-
-    for i in range(num_chunks):
+    def split_chunk(i):
+        """Encode and split one chunk; returns (vocals, accompaniment, sample_rate) or None"""
         start_sample = i * chunk_samples
-        end_sample = min((i + 1) * chunk_samples, len(audio_array))
-        chunk_array = audio_array[start_sample:end_sample]
+        end_sample = min((i + 1) * chunk_samples, total_samples)
+        chunk_array, _ = sf.read(audio_path, start=start_sample, stop=end_sample, dtype='float32')
 
         chunk_start_time = start_sample / sr
         chunk_end_time = end_sample / sr
@@ -462,8 +498,7 @@ def _audio_split_chunked(audio_array, sr, api_url, chunk_duration, verbose=True)
         # Save chunk to temporary WAV in memory
         chunk_buffer = io.BytesIO()
         sf.write(chunk_buffer, chunk_array, sr, format='WAV')
-        chunk_buffer.seek(0)
-        chunk_bytes = chunk_buffer.read()
+        chunk_bytes = chunk_buffer.getvalue()
 
         # Send chunk to API
         try:
@@ -471,7 +506,7 @@ def _audio_split_chunked(audio_array, sr, api_url, chunk_duration, verbose=True)
                 'audio': (f'chunk_{i}.wav', chunk_bytes, 'audio/wav')
             }
 
-            response = requests.post(
+            response = _SESSION.post(
                 f"{api_url}/v1/audio-split",
                 files=files,
                 timeout=300
@@ -479,9 +514,9 @@ def _audio_split_chunked(audio_array, sr, api_url, chunk_duration, verbose=True)
 
             if response.status_code != 200:
                 print_error(f"Chunk {i+1}/{num_chunks} failed: {response.status_code}")
-                return None, None, None
+                return None
 
-            result = response.json()
+            result = json_loads(response.content)
             result_sr = result.get('sample_rate', 16000)
 
             # Decode base64 audio streams
@@ -495,12 +530,34 @@ def _audio_split_chunked(audio_array, sr, api_url, chunk_duration, verbose=True)
             vocals_chunk_array, _ = sf.read(io.BytesIO(vocals_chunk_bytes), dtype='float32')
             accompaniment_chunk_array, _ = sf.read(io.BytesIO(accompaniment_chunk_bytes), dtype='float32')
 
-            vocals_chunks.append(vocals_chunk_array)
-            accompaniment_chunks.append(accompaniment_chunk_array)
+            return vocals_chunk_array, accompaniment_chunk_array, result_sr
 
         except Exception as e:
             print_error(f"Error processing chunk {i+1}/{num_chunks}: {e}")
-            return None, None, None
+            return None
+
+    vocals_chunks = []
+    accompaniment_chunks = []
+    result_sr = 16000  # Default sample rate
+
+    # Chunks are independent, so overlap their uploads and server-side
+    # processing; results are collected in chunk order
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, num_chunks))) as executor:
+        futures = [executor.submit(split_chunk, i) for i in range(num_chunks)]
+
+        try:
+            for future in futures:
+                chunk_result = future.result()
+                if chunk_result is None:
+                    return None, None, None
+
+                vocals_chunk_array, accompaniment_chunk_array, result_sr = chunk_result
+                vocals_chunks.append(vocals_chunk_array)
+                accompaniment_chunks.append(accompaniment_chunk_array)
+        finally:
+            # On a failed chunk, Ctrl-C or any other error, don't start chunks that
+            # are still queued; the executor exit then only waits for chunks in flight
+            executor.shutdown(wait=False, cancel_futures=True)
 
     # Concatenate all chunks
     if verbose:
@@ -564,6 +621,67 @@ def audio_split_background(audio_path, api_url, cache_dir):
         print_error(f"Background audio split error: {e}")
 
 
+def _run_refiner_and_log(process):
+    """Stream subtitle-refiner output and wait for it to exit (runs in background thread)"""
+    # tqdm.write serializes on tqdm's lock, so refiner lines interleave cleanly with progress bars
+    for line in process.stdout:
+        tqdm.write(line.rstrip('\n'))
+    process.wait()
+
+
+def start_subtitle_refiner(srt_path):
+    """
+    Launch subtitle-refiner on an SRT file without blocking
+
+    The refiner is I/O bound on LLM calls, so it runs concurrently with the
+    audio dubbing stage (which only depends on the timeline, not the SRT text).
+
+    Args:
+        srt_path: Path to generated SRT file
+
+    Returns:
+        Tuple of (process, thread) or None if the refiner could not be started
+    """
+    refiner_path = Path(__file__).parent.parent / 'stream-polyglot-refiner' / 'subtitle-refiner'
+
+    try:
+        # Use Popen with cwd parameter (cross-platform compatible)
+        process = subprocess.Popen(
+            ['node', 'dist/index.js', str(srt_path)],
+            cwd=str(refiner_path),  # Change directory using cwd parameter
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            universal_newlines=True,
+            encoding='utf-8',  # Explicitly use UTF-8 encoding for Windows compatibility
+            errors='replace'  # Replace invalid characters instead of crashing
+        )
+    except Exception as e:
+        print_error(f"Error running subtitle refiner: {e}")
+        print_warning("Continuing with unrefined subtitle...")
+        return None
+
+    thread = threading.Thread(target=_run_refiner_and_log, args=(process,), daemon=True)
+    thread.start()
+    return process, thread
+
+
+def wait_subtitle_refiner(refiner):
+    """Wait for background subtitle-refiner to finish and report its result"""
+    process, thread = refiner
+
+    if thread.is_alive():
+        print_info("Waiting for subtitle refiner to finish...")
+    thread.join()
+
+    if process.returncode == 0:
+        print_success("Subtitle refinement completed")
+    else:
+        print_error(f"Subtitle refiner failed with exit code {process.returncode}")
+        print_warning("Continuing with unrefined subtitle...")
+
+
 def voice_clone_translation(ref_audio_path, text, text_language, prompt_text, prompt_language, api_url, seed=-1, verbose=True):
     """
     Call m4t API for voice cloning
@@ -602,7 +720,7 @@ def voice_clone_translation(ref_audio_path, text, text_language, prompt_text, pr
         }
 
         # Call m4t voice-clone API
-        response = requests.post(
+        response = _SESSION.post(
             f"{api_url}/v1/voice-clone",
             files=files,
             data=data,
@@ -610,9 +728,8 @@ def voice_clone_translation(ref_audio_path, text, text_language, prompt_text, pr
         )
 
         if response.status_code == 200:
-            result = response.json()
+            result = json_loads(response.content)
             # Decode base64 audio
-            import base64
             audio_base64 = result.get('output_audio_base64', '')
             audio_bytes = base64.b64decode(audio_base64)
             return audio_bytes
@@ -629,10 +746,86 @@ def voice_clone_translation(ref_audio_path, text, text_language, prompt_text, pr
         return None
 
 
+def build_timeline_audio(fragments, total_duration, sample_rate):
+    """
+    Place translated audio fragments on a silent track at their timeline positions
+
+    Args:
+        fragments: List of dicts with keys: start, audio, sample_rate
+        total_duration: Output track duration in seconds
+        sample_rate: Output sample rate
+
+    Returns:
+        Mono float32 numpy array
+    """
+    # Create final audio array with silence gaps
+    final_duration_samples = int(total_duration * sample_rate)
+    final_audio = np.zeros(final_duration_samples, dtype=np.float32)
+
+    # Compute all start offsets in one pass
+    start_samples = (np.fromiter((f['start'] for f in fragments), dtype=np.float64,
+                                 count=len(fragments)) * sample_rate).astype(np.int64)
+
+    for fragment_data, start_sample in zip(fragments, start_samples):
+        # Skip fragments that fall entirely outside the output track
+        if start_sample < 0 or start_sample >= final_duration_samples:
+            continue
+
+        audio_data = fragment_data['audio']
+        fragment_sample_rate = fragment_data['sample_rate']
+
+        # Convert to mono if stereo
+        if len(audio_data.shape) > 1:
+            audio_data = np.mean(audio_data, axis=1)
+
+        # Resample if fragment sample rate doesn't match target
+        if fragment_sample_rate != sample_rate:
+            from scipy import signal
+            num_samples = int(len(audio_data) * sample_rate / fragment_sample_rate)
+            audio_data = signal.resample(audio_data, num_samples)
+
+        # Insert audio at correct position, truncating anything past the end:
+        # one contiguous copy per fragment, no end-of-track branch
+        audio_data = audio_data[:final_duration_samples - start_sample]
+        final_audio[start_sample:start_sample + len(audio_data)] = audio_data
+
+    return final_audio
+
+
+# Output WAV formats: CLI name -> soundfile subtype
+OUTPUT_FORMATS = {
+    'pcm16': 'PCM_16',
+    'float32': 'FLOAT',
+}
+
+
+def save_timeline_audio(final_audio, sample_rate, output_path, output_format='pcm16'):
+    """
+    Save final audio track to WAV file
+
+    16-bit PCM is the default (half the size of float32 WAV, no audible
+    difference for speech). For PCM output the samples are explicitly
+    clipped to [-1, 1] first; soundfile already saturates out-of-range
+    samples when writing, so this is a defensive step that does not
+    change the written file.
+
+    Args:
+        final_audio: Mono float32 numpy array (clipped in place for PCM output)
+        sample_rate: Sample rate
+        output_path: Output WAV file path
+        output_format: 'pcm16' (default) or 'float32'
+    """
+    subtype = OUTPUT_FORMATS[output_format]
+    if subtype == 'PCM_16':
+        # Defensive clip to the PCM range (soundfile also clips on write);
+        # done in place to avoid copying the whole track
+        np.clip(final_audio, -1.0, 1.0, out=final_audio)
+
+    sf.write(str(output_path), final_audio, sample_rate, subtype=subtype)
+
+
 def load_timeline_cache(cache_dir):
     """Load cached timeline data if available"""
-    import json
-
     timeline_json_path = os.path.join(cache_dir, 'timeline.json')
     if not os.path.exists(timeline_json_path):
         return None, None
@@ -649,10 +842,11 @@ def load_timeline_cache(cache_dir):
         if not fragments_dir or not os.path.exists(fragments_dir):
             return None, None
 
-        for fragment in timeline:
-            fragment_path = os.path.join(fragments_dir, fragment['file'])
-            if not os.path.exists(fragment_path):
-                return None, None
+        # One directory listing instead of a stat call per fragment
+        # (fragment 'file' entries are basenames inside fragments_dir)
+        existing_files = set(os.listdir(fragments_dir))
+        if any(fragment['file'] not in existing_files for fragment in timeline):
+            return None, None
 
         return timeline, metadata
     except Exception as e:
@@ -662,8 +856,6 @@ def load_timeline_cache(cache_dir):
 
 def save_timeline_cache(timeline, metadata, cache_dir, fragments_dir):
     """Save timeline data to cache file"""
-    import json
-
     os.makedirs(cache_dir, exist_ok=True)
     timeline_json_path = os.path.join(cache_dir, 'timeline.json')
 
@@ -682,7 +874,128 @@ def save_timeline_cache(timeline, metadata, cache_dir, fragments_dir):
         return False
 
 
-def process_video(input_file, source_lang, target_lang, generate_audio, generate_subtitle, subtitle_source_lang, output_dir, api_url, speaker_id=0, split_audio=False, run_subtitle_refiner=False):
+def start_background_audio_split(audio_path, api_url, cache_dir):
+    """Start audio splitting of an extracted audio file in a background thread"""
+    split_thread = threading.Thread(
+        target=audio_split_background,
+        args=(audio_path, api_url, cache_dir),
+        daemon=True
+    )
+    split_thread.start()
+    print_info("Audio splitting started in background (processing continues...)")
+
+
+def segment_audio_to_cache(input_file, cache_dir, api_url, split_audio=False, numbered_steps=True):
+    """
+    Extract audio from input file, segment it with VAD timeline and cache the result
+
+    Args:
+        input_file: Input video/audio file
+        cache_dir: Cache directory for timeline data and fragments
+        api_url: m4t API server URL
+        split_audio: Also start vocals/accompaniment splitting in background
+        numbered_steps: Label extraction/segmentation as "Step 1/4" and "Step 2/4"
+                        (the first two steps of subtitle/dubbing generation)
+
+    Returns:
+        Tuple of (timeline, metadata, fragments_dir) or (None, None, None) on error
+    """
+    fragments_dir = str(cache_dir / 'fragments')
+    os.makedirs(fragments_dir, exist_ok=True)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if split_audio:
+            # Background splitting keeps reading the extracted audio after
+            # segmentation returns, so keep it in the cache directory
+            split_audio_dir = cache_dir / 'temp_audio'
+            os.makedirs(split_audio_dir, exist_ok=True)
+            tmp_audio_path = str(split_audio_dir / 'extracted_audio.wav')
+        else:
+            tmp_audio_path = os.path.join(temp_dir, 'extracted_audio.wav')
+
+        try:
+            # Step 1: Extract audio from video
+            step = "Step 1/4: " if numbered_steps else ""
+            print_info(f"{step}Extracting audio from video...")
+            if not extract_audio(input_file, tmp_audio_path):
+                return None, None, None
+
+            # Split audio in background if requested
+            if split_audio:
+                start_background_audio_split(tmp_audio_path, api_url, cache_dir)
+
+            # Step 2: Segment audio with timeline
+            step = "Step 2/4: " if numbered_steps else ""
+            print_info(f"{step}Segmenting audio with VAD-based timeline...")
+            timeline, metadata = segment_with_timeline(
+                audio_path=tmp_audio_path,
+                output_dir=fragments_dir,
+                chunk_duration=30.0,
+                m4t_api_url=api_url,
+                save_timeline=False
+            )
+
+            fragment_count = len(timeline)
+            total_duration = metadata.get('total_duration', 0)
+            print_success(f"Segmented into {fragment_count} speech fragments")
+            print_info(f"Total audio duration: {total_duration:.2f}s")
+
+            # Save timeline to cache with fragments_dir
+            metadata['fragments_dir'] = fragments_dir
+            if split_audio:
+                metadata['split_audio'] = True
+            save_timeline_cache(timeline, metadata, cache_dir, fragments_dir)
+            print_success("Timeline cached for future use")
+
+            return timeline, metadata, fragments_dir
+
+        except Exception as e:
+            print_error(f"Error during audio extraction/segmentation: {e}")
+            traceback.print_exc()
+            return None, None, None
+
+
+def prepare_timeline(input_file, cache_dir, api_url, split_audio=False):
+    """
+    Load cached timeline for input file, or segment its audio if no cache exists
+
+    Args:
+        input_file: Input video/audio file
+        cache_dir: Cache directory for timeline data and fragments
+        api_url: m4t API server URL
+        split_audio: Also start vocals/accompaniment splitting in background
+
+    Returns:
+        Tuple of (timeline, metadata, fragments_dir) or (None, None, None) on error
+    """
+    # Try to load cached timeline first
+    timeline, metadata = load_timeline_cache(cache_dir)
+
+    if not timeline or not metadata:
+        print_info("No cached timeline found, performing segmentation...")
+        return segment_audio_to_cache(input_file, cache_dir, api_url, split_audio)
+
+    print_success("Found cached timeline data, skipping segmentation")
+    fragments_dir = metadata.get('fragments_dir', '')
+
+    print_info(f"Using {len(timeline)} cached speech fragments")
+    print_info(f"Total audio duration: {metadata.get('total_duration', 0):.2f}s")
+
+    # If split_audio is requested, extract audio and run splitting in background
+    if split_audio:
+        # Use cache directory for temporary audio (won't be auto-deleted)
+        split_audio_dir = cache_dir / 'temp_audio'
+        os.makedirs(split_audio_dir, exist_ok=True)
+        tmp_audio_path = str(split_audio_dir / 'extracted_audio.wav')
+
+        print_info("Extracting audio for splitting...")
+        if extract_audio(input_file, tmp_audio_path):
+            start_background_audio_split(tmp_audio_path, api_url, cache_dir)
+
+    return timeline, metadata, fragments_dir
+
+
+def process_video(input_file, source_lang, target_lang, generate_audio, generate_subtitle, subtitle_source_lang, output_dir, api_url, speaker_id=0, split_audio=False, run_subtitle_refiner=False, output_format='pcm16', workers=4):
     """Process video file for translation"""
 
     print_header("Stream-Polyglot Video Translation")
@@ -730,6 +1043,15 @@ def process_video(input_file, source_lang, target_lang, generate_audio, generate
     cache_dir = output_dir / '.stream-polyglot-cache' / input_path.stem
     os.makedirs(cache_dir, exist_ok=True)
 
+    # Load or build the timeline once; subtitle and audio generation share it
+    timeline, metadata, fragments_dir = prepare_timeline(input_file, cache_dir, api_url, split_audio)
+    if timeline is None:
+        return 1
+    fragment_count = len(timeline)
+
+    # Background subtitle-refiner job (process, thread), if started
+    refiner = None
+
     # Process subtitle generation with timeline
     if generate_subtitle:
         print_header("Subtitle Generation with Timeline")
@@ -737,172 +1059,102 @@ def process_video(input_file, source_lang, target_lang, generate_audio, generate
         print_info(f"Audio language: {source_lang}")
         print_info(f"Subtitle language: {target_lang}")
 
-        # Try to load cached timeline first
-        cached_timeline, cached_metadata = load_timeline_cache(cache_dir)
-
-        if cached_timeline and cached_metadata:
-            print_success("Found cached timeline data, skipping segmentation")
-            timeline = cached_timeline
-            metadata = cached_metadata
-            fragments_dir = cached_metadata.get('fragments_dir', '')
+        try:
+            # Step 3: Translate each fragment
+            print_info(f"Step 3/4: Translating {fragment_count} fragments...")
+            subtitles = []
 
-            fragment_count = len(timeline)
-            total_duration = metadata.get('total_duration', 0)
-            print_info(f"Using {fragment_count} cached speech fragments")
-            print_info(f"Total audio duration: {total_duration:.2f}s")
+            def translate_fragment(i, fragment):
+                """Transcribe (optional) and translate one fragment; returns (source_text, result)"""
+                fragment_path = os.path.join(fragments_dir, fragment['file'])
 
-            # If split_audio is requested, extract audio and run splitting in background
-            if split_audio:
-                # Use cache directory for temporary audio (won't be auto-deleted)
-                split_audio_dir = cache_dir / 'temp_audio'
-                os.makedirs(split_audio_dir, exist_ok=True)
-                tmp_audio_path = str(split_audio_dir / 'extracted_audio.wav')
-
-                print_info("Extracting audio for splitting...")
-                if extract_audio(input_file, tmp_audio_path):
-                    # Start audio splitting in background thread
-                    split_thread = threading.Thread(
-                        target=audio_split_background,
-                        args=(tmp_audio_path, api_url, cache_dir),
-                        daemon=True
-                    )
-                    split_thread.start()
-                    print_info("Audio splitting started in background (processing continues...)")
-        else:
-            # Need to segment audio - create persistent cache directory for fragments
-            print_info("No cached timeline found, performing segmentation...")
-            fragments_dir = str(cache_dir / 'fragments')
-            os.makedirs(fragments_dir, exist_ok=True)
+                source_text = None
+                # If subtitle_source_lang is set, transcribe source language first
+                if subtitle_source_lang:
+                    try:
+                        with open(fragment_path, 'rb') as f:
+                            audio_data = f.read()
 
-            with tempfile.TemporaryDirectory() as temp_dir:
-                tmp_audio_path = os.path.join(temp_dir, 'extracted_audio.wav')
+                        files = {'audio': ('audio.wav', audio_data, 'audio/wav')}
+                        data = {'language': source_lang}
 
-                try:
-                    # Step 1: Extract audio from video
-                    print_info("Step 1/4: Extracting audio from video...")
-                    if not extract_audio(input_file, tmp_audio_path):
-                        return 1
-
-                    # Step 1.5: Split audio if --split flag is set (run in background)
-                    audio_for_segmentation = tmp_audio_path
-                    if split_audio:
-                        # Start audio splitting in background thread
-                        split_thread = threading.Thread(
-                            target=audio_split_background,
-                            args=(tmp_audio_path, api_url, cache_dir),
-                            daemon=True
+                        response = _SESSION.post(
+                            f"{api_url}/v1/transcribe",
+                            files=files,
+                            data=data,
+                            timeout=60
                         )
-                        split_thread.start()
-                        print_info("Audio splitting started in background (processing continues...)")
-
-                    # Step 2: Segment audio with timeline
-                    print_info("Step 2/4: Segmenting audio with VAD-based timeline...")
-                    timeline, metadata = segment_with_timeline(
-                        audio_path=audio_for_segmentation,
-                        output_dir=fragments_dir,
-                        chunk_duration=30.0,
-                        m4t_api_url=api_url,
-                        save_timeline=False
-                    )
-
-                    fragment_count = len(timeline)
-                    total_duration = metadata.get('total_duration', 0)
-                    print_success(f"Segmented into {fragment_count} speech fragments")
-                    print_info(f"Total audio duration: {total_duration:.2f}s")
-
-                    # Save timeline to cache with fragments_dir
-                    metadata['fragments_dir'] = fragments_dir
-                    if split_audio:
-                        metadata['split_audio'] = True
-                    save_timeline_cache(timeline, metadata, cache_dir, fragments_dir)
-                    print_success("Timeline cached for future use")
-
-                except Exception as e:
-                    print_error(f"Error during audio extraction/segmentation: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    return 1
 
-        try:
-            # Step 3: Translate each fragment
-            print_info(f"Step 3/4: Translating {fragment_count} fragments...")
-            subtitles = []
+                        if response.status_code == 200:
+                            asr_result = json_loads(response.content)
+                            source_text = asr_result.get('output_text', '').strip()
+                    except Exception as e:
+                        tqdm.write(f"{Colors.RED}✗ Fragment {i}: Source transcription failed: {e}{Colors.END}")
 
-            # Use tqdm progress bar
-            with tqdm(total=fragment_count, desc="Translating", unit="fragment",
-                     bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]',
-                     ncols=80) as pbar:
-                    for i, fragment in enumerate(timeline):
-                        fragment_path = os.path.join(fragments_dir, fragment['file'])
-
-                        source_text = None
-                        # If subtitle_source_lang is set, transcribe source language first
-                        if subtitle_source_lang:
-                            try:
-                                with open(fragment_path, 'rb') as f:
-                                    audio_data = f.read()
-
-                                files = {'audio': ('audio.wav', audio_data, 'audio/wav')}
-                                data = {'language': source_lang}
-
-                                response = requests.post(
-                                    f"{api_url}/v1/transcribe",
-                                    files=files,
-                                    data=data,
-                                    timeout=60
-                                )
-
-                                if response.status_code == 200:
-                                    asr_result = response.json()
-                                    source_text = asr_result.get('output_text', '').strip()
-                            except Exception as e:
-                                tqdm.write(f"{Colors.RED}✗ Fragment {i}: Source transcription failed: {e}{Colors.END}")
-
-                        # Translate fragment to target language
-                        result = speech_to_text_translation(fragment_path, source_lang, target_lang, api_url, verbose=False)
-
-                        translated_text = None
-                        if result and result.get('output_text'):
-                            translated_text = result['output_text'].strip()
-
-                        # Build subtitle entry if we have at least one text (source or target)
-                        if translated_text or source_text:
-                            # Construct combined text based on what's available
-                            if subtitle_source_lang:
-                                # Bilingual mode: target on first line, source on second line
-                                if translated_text and source_text:
-                                    # Both succeeded - ideal case
-                                    combined_text = f"{translated_text}\n{source_text}"
-                                elif translated_text:
-                                    # Only target succeeded - show target with placeholder
-                                    combined_text = f"{translated_text}\n[Source transcription failed]"
-                                elif source_text:
-                                    # Only source succeeded - show source with placeholder
-                                    combined_text = f"[Translation failed]\n{source_text}"
+                # Translate fragment to target language
+                result = speech_to_text_translation(fragment_path, source_lang, target_lang, api_url, verbose=False)
+
+                return source_text, result
+
+            # Fragments are independent, so run API calls concurrently and
+            # collect results in timeline order
+            with ThreadPoolExecutor(max_workers=max(1, workers)) as executor, \
+                 tqdm(total=fragment_count, desc="Translating", unit="fragment",
+                      bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]',
+                      ncols=80) as pbar:
+                    futures = [executor.submit(translate_fragment, i, fragment) for i, fragment in enumerate(timeline)]
+
+                    try:
+                        for i, (fragment, future) in enumerate(zip(timeline, futures)):
+                            source_text, result = future.result()
+
+                            translated_text = None
+                            if result and result.get('output_text'):
+                                translated_text = result['output_text'].strip()
+
+                            # Build subtitle entry if we have at least one text (source or target)
+                            if translated_text or source_text:
+                                # Construct combined text based on what's available
+                                if subtitle_source_lang:
+                                    # Bilingual mode: target on first line, source on second line
+                                    if translated_text and source_text:
+                                        # Both succeeded - ideal case
+                                        combined_text = f"{translated_text}\n{source_text}"
+                                    elif translated_text:
+                                        # Only target succeeded - show target with placeholder
+                                        combined_text = f"{translated_text}\n[Source transcription failed]"
+                                    elif source_text:
+                                        # Only source succeeded - show source with placeholder
+                                        combined_text = f"[Translation failed]\n{source_text}"
+                                    else:
+                                        # Should not reach here due to outer if condition
+                                        combined_text = "[Both failed]"
                                 else:
-                                    # Should not reach here due to outer if condition
-                                    combined_text = "[Both failed]"
+                                    # Single language mode: only use translated text
+                                    if translated_text:
+                                        combined_text = translated_text
+                                    else:
+                                        # Translation failed, skip this fragment in single-lang mode
+                                        tqdm.write(f"{Colors.YELLOW}⚠ Fragment {i}: Translation failed, skipping{Colors.END}")
+                                        pbar.update(1)
+                                        continue
+
+                                subtitles.append({
+                                    'start': fragment['start'],
+                                    'end': fragment['end'],
+                                    'text': combined_text
+                                })
                             else:
-                                # Single language mode: only use translated text
-                                if translated_text:
-                                    combined_text = translated_text
-                                else:
-                                    # Translation failed, skip this fragment in single-lang mode
-                                    tqdm.write(f"{Colors.YELLOW}⚠ Fragment {i}: Translation failed, skipping{Colors.END}")
-                                    pbar.update(1)
-                                    continue
-
-                            subtitles.append({
-                                'start': fragment['start'],
-                                'end': fragment['end'],
-                                'text': combined_text
-                            })
-                        else:
-                            # Both failed in bilingual mode, or translation failed in single-lang mode
-                            tqdm.write(f"{Colors.YELLOW}⚠ Fragment {i}: All transcription/translation failed, skipping{Colors.END}")
+                                # Both failed in bilingual mode, or translation failed in single-lang mode
+                                tqdm.write(f"{Colors.YELLOW}⚠ Fragment {i}: All transcription/translation failed, skipping{Colors.END}")
 
-                        # Update progress bar
-                        pbar.update(1)
+                            # Update progress bar
+                            pbar.update(1)
+                    except BaseException:
+                        # On Ctrl-C or an error, drop queued fragments instead of letting the
+                        # executor exit wait for every remaining API call
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        raise
 
             # Step 4: Generate and save SRT files
             print_info(f"Step 4/4: Generating SRT subtitle files...")
@@ -928,46 +1180,15 @@ def process_video(input_file, source_lang, target_lang, generate_audio, generate
             output_srt_path = Path(output_dir) / output_srt_filename
 
             # Generate and save SRT
-            srt_content = generate_srt_content(subtitles, merge_short=True)
-            if save_srt_file(srt_content, str(output_srt_path)):
+            # Subtitles were built in timeline order, so no re-sort is needed
+            if generate_srt_to_file(subtitles, str(output_srt_path), merge_short=True, already_sorted=True):
                 print_success(f"{subtitle_type} subtitle saved: {output_srt_path}")
 
-                # Run subtitle-refiner if requested
+                # Run subtitle-refiner in background if requested
                 if run_subtitle_refiner:
                     print_header("Running Subtitle Refiner")
-                    print_info("Refining subtitle translations with LLM...")
-
-                    refiner_path = Path(__file__).parent.parent / 'stream-polyglot-refiner' / 'subtitle-refiner'
-
-                    try:
-                        # Use Popen with cwd parameter (cross-platform compatible)
-                        process = subprocess.Popen(
-                            ['node', 'dist/index.js', str(output_srt_path)],
-                            cwd=str(refiner_path),  # Change directory using cwd parameter
-                            stdout=subprocess.PIPE,
-                            stderr=subprocess.STDOUT,
-                            text=True,
-                            bufsize=1,
-                            universal_newlines=True,
-                            encoding='utf-8',  # Explicitly use UTF-8 encoding for Windows compatibility
-                            errors='replace'  # Replace invalid characters instead of crashing
-                        )
-
-                        # Stream output line by line
-                        for line in process.stdout:
-                            print(line, end='')
-
-                        # Wait for process to complete
-                        return_code = process.wait()
-
-                        if return_code == 0:
-                            print_success("Subtitle refinement completed")
-                        else:
-                            print_error(f"Subtitle refiner failed with exit code {return_code}")
-                            print_warning("Continuing with unrefined subtitle...")
-                    except Exception as e:
-                        print_error(f"Error running subtitle refiner: {e}")
-                        print_warning("Continuing with unrefined subtitle...")
+                    print_info("Refining subtitle translations with LLM (in background)...")
+                    refiner = start_subtitle_refiner(output_srt_path)
             else:
                 print_error(f"Failed to save {subtitle_type.lower()} subtitle")
                 return 1
@@ -981,212 +1202,106 @@ def process_video(input_file, source_lang, target_lang, generate_audio, generate
 
         except Exception as e:
             print_error(f"Error during subtitle generation: {e}")
-            import traceback
             traceback.print_exc()
             return 1
 
-    # Process audio dubbing with timeline-based translation
-    if generate_audio:
-        print_header("Audio Dubbing Generation with Timeline")
-
-        print_info(f"Audio language: {source_lang}")
-        print_info(f"Dubbed language: {target_lang}")
-
-        # Try to load cached timeline first
-        cached_timeline, cached_metadata = load_timeline_cache(cache_dir)
+    try:
+        # Process audio dubbing with timeline-based translation
+        if generate_audio:
+            print_header("Audio Dubbing Generation with Timeline")
 
-        if cached_timeline and cached_timeline and cached_metadata:
-            print_success("Found cached timeline data, skipping segmentation")
-            timeline = cached_timeline
-            metadata = cached_metadata
-            fragments_dir = cached_metadata.get('fragments_dir', '')
+            print_info(f"Audio language: {source_lang}")
+            print_info(f"Dubbed language: {target_lang}")
 
-            fragment_count = len(timeline)
             total_duration = metadata.get('total_duration', 0)
             sample_rate = metadata.get('sample_rate', 16000)
-            print_info(f"Using {fragment_count} cached speech fragments")
-            print_info(f"Total audio duration: {total_duration:.2f}s")
-
-            # If split_audio is requested, extract audio and run splitting in background
-            if split_audio:
-                # Use cache directory for temporary audio (won't be auto-deleted)
-                split_audio_dir = cache_dir / 'temp_audio'
-                os.makedirs(split_audio_dir, exist_ok=True)
-                tmp_audio_path = str(split_audio_dir / 'extracted_audio.wav')
-
-                print_info("Extracting audio for splitting...")
-                if extract_audio(input_file, tmp_audio_path):
-                    # Start audio splitting in background thread
-                    split_thread = threading.Thread(
-                        target=audio_split_background,
-                        args=(tmp_audio_path, api_url, cache_dir),
-                        daemon=True
-                    )
-                    split_thread.start()
-                    print_info("Audio splitting started in background (processing continues...)")
-        else:
-            # Need to segment audio - create persistent cache directory for fragments
-            print_info("No cached timeline found, performing segmentation...")
-            fragments_dir = str(cache_dir / 'fragments')
-            os.makedirs(fragments_dir, exist_ok=True)
-
-            with tempfile.TemporaryDirectory() as temp_dir:
-                tmp_audio_path = os.path.join(temp_dir, 'extracted_audio.wav')
-
-                try:
-                    # Step 1: Extract audio from video
-                    print_info("Step 1/4: Extracting audio from video...")
-                    if not extract_audio(input_file, tmp_audio_path):
-                        return 1
-
-                    # Step 1.5: Split audio if --split flag is set (run in background)
-                    audio_for_segmentation = tmp_audio_path
-                    if split_audio:
-                        # Start audio splitting in background thread
-                        split_thread = threading.Thread(
-                            target=audio_split_background,
-                            args=(tmp_audio_path, api_url, cache_dir),
-                            daemon=True
-                        )
-                        split_thread.start()
-                        print_info("Audio splitting started in background (processing continues...)")
-
-                    # Step 2: Segment audio with timeline
-                    print_info("Step 2/4: Segmenting audio with VAD-based timeline...")
-                    timeline, metadata = segment_with_timeline(
-                        audio_path=audio_for_segmentation,
-                        output_dir=fragments_dir,
-                        chunk_duration=30.0,
-                        m4t_api_url=api_url,
-                        save_timeline=False
-                    )
-
-                    fragment_count = len(timeline)
-                    total_duration = metadata.get('total_duration', 0)
-                    sample_rate = metadata.get('sample_rate', 16000)
-                    print_success(f"Segmented into {fragment_count} speech fragments")
-                    print_info(f"Total audio duration: {total_duration:.2f}s")
-
-                    # Save timeline to cache with fragments_dir
-                    metadata['fragments_dir'] = fragments_dir
-                    if split_audio:
-                        metadata['split_audio'] = True
-                    save_timeline_cache(timeline, metadata, cache_dir, fragments_dir)
-                    print_success("Timeline cached for future use")
-
-                except Exception as e:
-                    print_error(f"Error during audio extraction/segmentation: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    return 1
 
-        try:
-            # Step 3: Translate each fragment to audio
-            print_info(f"Step 3/4: Translating {fragment_count} fragments to speech...")
+            try:
+                # Step 3: Translate each fragment to audio
+                print_info(f"Step 3/4: Translating {fragment_count} fragments to speech...")
+
+                translated_fragments = []
+
+                # Use tqdm progress bar
+                with tqdm(total=fragment_count, desc="Translating", unit="fragment",
+                         bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]',
+                         ncols=80) as pbar:
+                        for i, fragment in enumerate(timeline):
+                            fragment_path = os.path.join(fragments_dir, fragment['file'])
+
+                            # Translate fragment to target language speech
+                            s2st_result = speech_to_speech_translation(
+                                fragment_path, source_lang, target_lang, api_url, speaker_id, verbose=False
+                            )
+
+                            if s2st_result and s2st_result.get('output_audio_base64'):
+                                # Decode base64 audio to numpy array
+                                audio_base64 = s2st_result['output_audio_base64']
+                                audio_bytes = base64.b64decode(audio_base64)
+
+                                # Load audio from bytes
+                                audio_array, sr = sf.read(io.BytesIO(audio_bytes))
+
+                                # Store translated fragment with timing
+                                translated_fragments.append({
+                                    'start': fragment['start'],
+                                    'end': fragment['end'],
+                                    'audio': audio_array,
+                                    'sample_rate': sr
+                                })
+                            else:
+                                tqdm.write(f"{Colors.YELLOW}⚠ Fragment {i}: Translation failed, skipping{Colors.END}")
 
-            import numpy as np
-            import soundfile as sf
-            import base64
+                            # Update progress bar
+                            pbar.update(1)
 
-            translated_fragments = []
+                # Step 4: Concatenate fragments with timeline alignment
+                print_info(f"Step 4/4: Concatenating {len(translated_fragments)} translated fragments...")
 
-            # Use tqdm progress bar
-            with tqdm(total=fragment_count, desc="Translating", unit="fragment",
-                     bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]',
-                     ncols=80) as pbar:
-                    for i, fragment in enumerate(timeline):
-                        fragment_path = os.path.join(fragments_dir, fragment['file'])
+                if not translated_fragments:
+                    print_error("No audio fragments translated")
+                    return 1
 
-                        # Translate fragment to target language speech
-                        s2st_result = speech_to_speech_translation(
-                            fragment_path, source_lang, target_lang, api_url, speaker_id, verbose=False
-                        )
+                final_audio = build_timeline_audio(translated_fragments, total_duration, sample_rate)
 
-                        if s2st_result and s2st_result.get('output_audio_base64'):
-                            # Decode base64 audio to numpy array
-                            audio_base64 = s2st_result['output_audio_base64']
-                            audio_bytes = base64.b64decode(audio_base64)
+                # Ensure output directory exists
+                os.makedirs(output_dir, exist_ok=True)
 
-                            # Load audio from bytes
-                            import io
-                            audio_array, sr = sf.read(io.BytesIO(audio_bytes))
+                # Generate output filename
+                input_path = Path(input_file)
+                output_filename = f"{input_path.stem}.{target_lang}.wav"
+                output_path = Path(output_dir) / output_filename
 
-                            # Store translated fragment with timing
-                            translated_fragments.append({
-                                'start': fragment['start'],
-                                'end': fragment['end'],
-                                'audio': audio_array,
-                                'sample_rate': sr
-                            })
-                        else:
-                            tqdm.write(f"{Colors.YELLOW}⚠ Fragment {i}: Translation failed, skipping{Colors.END}")
+                # Save final audio
+                print_info(f"Saving audio to: {output_path}")
+                save_timeline_audio(final_audio, sample_rate, output_path, output_format)
+                print_success(f"Audio saved to: {output_path}")
 
-                        # Update progress bar
-                        pbar.update(1)
+                # Get file size for result display
+                file_size = os.path.getsize(output_path) / 1024  # KB
 
-            # Step 4: Concatenate fragments with timeline alignment
-            print_info(f"Step 4/4: Concatenating {len(translated_fragments)} translated fragments...")
+                # Print result summary
+                print_header("Audio Dubbing Result")
+                print_success("Audio dubbing completed!")
+                print_success(f"Translated {len(translated_fragments)} speech fragments")
+                print_info(f"Output file: {output_path}")
+                print_info(f"File size: {file_size:.1f} KB")
+                print_info(f"Sample rate: {sample_rate} Hz")
+                print_info(f"Duration: {total_duration:.2f} seconds")
 
-            if not translated_fragments:
-                print_error("No audio fragments translated")
+            except Exception as e:
+                print_error(f"Error during audio dubbing: {e}")
+                traceback.print_exc()
                 return 1
-
-            # Create final audio array with silence gaps
-            final_duration_samples = int(total_duration * sample_rate)
-            final_audio = np.zeros(final_duration_samples, dtype=np.float32)
-
-            for fragment_data in translated_fragments:
-                start_sample = int(fragment_data['start'] * sample_rate)
-                audio_data = fragment_data['audio']
-
-                # Convert to mono if stereo
-                if len(audio_data.shape) > 1:
-                    audio_data = np.mean(audio_data, axis=1)
-
-                # Insert audio at correct position
-                end_sample = start_sample + len(audio_data)
-                if end_sample <= final_duration_samples:
-                    final_audio[start_sample:end_sample] = audio_data
-                else:
-                    # Truncate if exceeds total duration
-                    available = final_duration_samples - start_sample
-                    final_audio[start_sample:] = audio_data[:available]
-
-            # Ensure output directory exists
-            os.makedirs(output_dir, exist_ok=True)
-
-            # Generate output filename
-            input_path = Path(input_file)
-            output_filename = f"{input_path.stem}.{target_lang}.wav"
-            output_path = Path(output_dir) / output_filename
-
-            # Save final audio
-            print_info(f"Saving audio to: {output_path}")
-            sf.write(str(output_path), final_audio, sample_rate)
-            print_success(f"Audio saved to: {output_path}")
-
-            # Get file size for result display
-            file_size = os.path.getsize(output_path) / 1024  # KB
-
-            # Print result summary
-            print_header("Audio Dubbing Result")
-            print_success("Audio dubbing completed!")
-            print_success(f"Translated {len(translated_fragments)} speech fragments")
-            print_info(f"Output file: {output_path}")
-            print_info(f"File size: {file_size:.1f} KB")
-            print_info(f"Sample rate: {sample_rate} Hz")
-            print_info(f"Duration: {total_duration:.2f} seconds")
-
-        except Exception as e:
-            print_error(f"Error during audio dubbing: {e}")
-            import traceback
-            traceback.print_exc()
-            return 1
+    finally:
+        # Refiner ran concurrently with audio dubbing; collect its result
+        if refiner:
+            wait_subtitle_refiner(refiner)
 
     return 0
 
 
-def process_trans_voice(input_file, srt_file, source_lang, target_lang, output_dir, api_url, seed=None):
+def process_trans_voice(input_file, srt_file, source_lang, target_lang, output_dir, api_url, seed=None, output_format='pcm16', workers=4):
     """
     Process voice cloning translation from bilingual SRT file
 
@@ -1198,12 +1313,12 @@ def process_trans_voice(input_file, srt_file, source_lang, target_lang, output_d
         output_dir: Output directory for generated audio
         api_url: m4t API server URL
         seed: Random seed for reproducibility (None for random-but-fixed, >=0 for specific seed)
+        output_format: Output WAV format ('pcm16' or 'float32')
+        workers: Number of concurrent voice-clone API requests
 
     Returns:
         Exit code (0 for success, 1 for error)
     """
-    import random
-
     # Generate random seed once for this generation process if not specified
     if seed is None:
         seed = random.randint(0, 1000000)
@@ -1271,43 +1386,9 @@ def process_trans_voice(input_file, srt_file, source_lang, target_lang, output_d
             return 1
 
         print_info("No cached timeline found, performing audio segmentation...")
-        fragments_dir = str(cache_dir / 'fragments')
-        os.makedirs(fragments_dir, exist_ok=True)
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            tmp_audio_path = os.path.join(temp_dir, 'extracted_audio.wav')
-
-            try:
-                # Step 0a: Extract audio from video
-                print_info("Extracting audio from video...")
-                if not extract_audio(input_file, tmp_audio_path):
-                    return 1
-
-                # Step 0b: Segment audio with timeline
-                print_info("Segmenting audio with VAD-based timeline...")
-                timeline, metadata = segment_with_timeline(
-                    audio_path=tmp_audio_path,
-                    output_dir=fragments_dir,
-                    chunk_duration=30.0,
-                    m4t_api_url=api_url,
-                    save_timeline=False
-                )
-
-                fragment_count = len(timeline)
-                total_duration = metadata.get('total_duration', 0)
-                print_success(f"Segmented into {fragment_count} speech fragments")
-                print_info(f"Total audio duration: {total_duration:.2f}s")
-
-                # Save timeline to cache
-                metadata['fragments_dir'] = fragments_dir
-                save_timeline_cache(timeline, metadata, cache_dir, fragments_dir)
-                print_success("Timeline cached for future use")
-
-            except Exception as e:
-                print_error(f"Error during audio extraction/segmentation: {e}")
-                import traceback
-                traceback.print_exc()
-                return 1
+        timeline, metadata, fragments_dir = segment_audio_to_cache(input_file, cache_dir, api_url, numbered_steps=False)
+        if timeline is None:
+            return 1
     else:
         timeline = cached_timeline
         metadata = cached_metadata
@@ -1331,6 +1412,15 @@ def process_trans_voice(input_file, srt_file, source_lang, target_lang, output_d
         timing_tolerance = 0.5  # 0.5 second tolerance for timing match
         matched_segments = []
 
+        # Fragment timing as arrays, built once for vectorized matching
+        frag_starts = np.fromiter((f['start'] for f in timeline), dtype=np.float64, count=len(timeline))
+        frag_ends = np.fromiter((f['end'] for f in timeline), dtype=np.float64, count=len(timeline))
+
+        # Start-sorted view so each subtitle only examines fragments whose start
+        # falls inside the tolerance window (binary search instead of a full scan)
+        start_order = np.argsort(frag_starts, kind='stable')
+        sorted_starts = frag_starts[start_order]
+
         for i, subtitle in enumerate(subtitles):
             sub_start = subtitle['start']
             sub_end = subtitle['end']
@@ -1344,21 +1434,22 @@ def process_trans_voice(input_file, srt_file, source_lang, target_lang, output_d
                 continue
 
             # Find matching cached fragment by timing
+            # (start time within tolerance, then smallest start + end difference)
             best_match = None
-            best_diff = float('inf')
+            # Window is padded slightly; the exact tolerance check is applied below
+            lo = np.searchsorted(sorted_starts, sub_start - timing_tolerance - 1e-6, side='left')
+            hi = np.searchsorted(sorted_starts, sub_start + timing_tolerance + 1e-6, side='right')
+            # Timeline order, so ties resolve to the earliest fragment as before
+            candidates = np.sort(start_order[lo:hi])
 
-            for fragment in cached_timeline:
-                frag_start = fragment['start']
-                frag_end = fragment['end']
+            start_diff = np.abs(frag_starts[candidates] - sub_start)
+            total_diff = start_diff + np.abs(frag_ends[candidates] - sub_end)
+            total_diff[start_diff > timing_tolerance] = np.inf
 
-                # Calculate timing difference (use start time as primary match)
-                start_diff = abs(sub_start - frag_start)
-                end_diff = abs(sub_end - frag_end)
-                total_diff = start_diff + end_diff
-
-                if start_diff <= timing_tolerance and total_diff < best_diff:
-                    best_match = fragment
-                    best_diff = total_diff
+            if len(total_diff):
+                best_index = int(np.argmin(total_diff))
+                if np.isfinite(total_diff[best_index]):
+                    best_match = timeline[int(candidates[best_index])]
 
             if best_match:
                 fragment_path = os.path.join(fragments_dir, best_match['file'])
@@ -1390,44 +1481,53 @@ def process_trans_voice(input_file, srt_file, source_lang, target_lang, output_d
         print_header("Step 3/4: Voice Cloning Translation")
         print_info(f"Cloning {len(matched_segments)} segments...")
 
-        import numpy as np
-        import soundfile as sf
-        import io
-
         cloned_segments = []
 
-        # Use tqdm progress bar
-        with tqdm(total=len(matched_segments), desc="Cloning", unit="segment",
-                 bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]',
-                 ncols=80) as pbar:
-                for seg in matched_segments:
-                    # Call voice-clone API with the same seed for all segments
-                    audio_bytes = voice_clone_translation(
-                        ref_audio_path=seg['ref_audio_path'],
-                        text=seg['target_text'],
-                        text_language=target_lang,
-                        prompt_text=seg['source_text'],
-                        prompt_language=source_lang,
-                        api_url=api_url,
-                        seed=seed,
-                        verbose=False
-                    )
-
-                    if audio_bytes:
-                        # Load audio from bytes
-                        audio_array, sr = sf.read(io.BytesIO(audio_bytes))
-
-                        cloned_segments.append({
-                            'start': seg['start'],
-                            'end': seg['end'],
-                            'audio': audio_array,
-                            'sample_rate': sr
-                        })
-                    else:
-                        tqdm.write(f"{Colors.YELLOW}⚠ Segment {seg['subtitle_index']}: Voice cloning failed, skipping{Colors.END}")
-
-                    # Update progress bar
-                    pbar.update(1)
+        def clone_segment(seg):
+            # Call voice-clone API with the same seed for all segments
+            return voice_clone_translation(
+                ref_audio_path=seg['ref_audio_path'],
+                text=seg['target_text'],
+                text_language=target_lang,
+                prompt_text=seg['source_text'],
+                prompt_language=source_lang,
+                api_url=api_url,
+                seed=seed,
+                verbose=False
+            )
+
+        # Segments are independent (fixed seed), so run API calls concurrently
+        # and collect results in subtitle order
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor, \
+             tqdm(total=len(matched_segments), desc="Cloning", unit="segment",
+                  bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]',
+                  ncols=80) as pbar:
+                futures = [executor.submit(clone_segment, seg) for seg in matched_segments]
+
+                try:
+                    for seg, future in zip(matched_segments, futures):
+                        audio_bytes = future.result()
+
+                        if audio_bytes:
+                            # Load audio from bytes
+                            audio_array, sr = sf.read(io.BytesIO(audio_bytes))
+
+                            cloned_segments.append({
+                                'start': seg['start'],
+                                'end': seg['end'],
+                                'audio': audio_array,
+                                'sample_rate': sr
+                            })
+                        else:
+                            tqdm.write(f"{Colors.YELLOW}⚠ Segment {seg['subtitle_index']}: Voice cloning failed, skipping{Colors.END}")
+
+                        # Update progress bar
+                        pbar.update(1)
+                except BaseException:
+                    # On Ctrl-C or an error, drop queued segments instead of letting the
+                    # executor exit wait for every remaining API call
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
 
         if not cloned_segments:
             print_error("No segments successfully cloned")
@@ -1440,7 +1540,7 @@ def process_trans_voice(input_file, srt_file, source_lang, target_lang, output_d
         print_info(f"Concatenating {len(cloned_segments)} cloned segments...")
 
         # Get total duration from metadata or calculate from last segment
-        total_duration = cached_metadata.get('total_duration', 0)
+        total_duration = metadata.get('total_duration', 0)
         if total_duration == 0 and cloned_segments:
             total_duration = max(seg['end'] for seg in cloned_segments)
 
@@ -1456,41 +1556,9 @@ def process_trans_voice(input_file, srt_file, source_lang, target_lang, output_d
                 print_info(f"All segments will be resampled to {TARGET_SAMPLE_RATE} Hz")
             sample_rate = TARGET_SAMPLE_RATE
         else:
-            sample_rate = cached_metadata.get('sample_rate', 16000)
-
-        # Create final audio array with silence gaps
-        final_duration_samples = int(total_duration * sample_rate)
-        final_audio = np.zeros(final_duration_samples, dtype=np.float32)
-
-        for seg_data in cloned_segments:
-            start_sample = int(seg_data['start'] * sample_rate)
-            audio_data = seg_data['audio']
-            seg_sample_rate = seg_data['sample_rate']
-
-            # Convert to mono if stereo
-            if len(audio_data.shape) > 1:
-                audio_data = np.mean(audio_data, axis=1)
-
-            # Ensure float32
-            if audio_data.dtype != np.float32:
-                audio_data = audio_data.astype(np.float32)
-
-            # Resample if segment sample rate doesn't match target
-            if seg_sample_rate != sample_rate:
-                from scipy import signal
-                # Calculate resampling ratio
-                num_samples = int(len(audio_data) * sample_rate / seg_sample_rate)
-                audio_data = signal.resample(audio_data, num_samples)
-
-            # Insert audio at correct position
-            end_sample = start_sample + len(audio_data)
-            if end_sample <= final_duration_samples:
-                final_audio[start_sample:end_sample] = audio_data
-            else:
-                # Truncate if exceeds total duration
-                available = final_duration_samples - start_sample
-                if available > 0:
-                    final_audio[start_sample:] = audio_data[:available]
+            sample_rate = metadata.get('sample_rate', 16000)
+
+        final_audio = build_timeline_audio(cloned_segments, total_duration, sample_rate)
 
         # Ensure output directory exists
         os.makedirs(output_dir, exist_ok=True)
@@ -1502,7 +1570,7 @@ def process_trans_voice(input_file, srt_file, source_lang, target_lang, output_d
 
         # Save final audio
         print_info(f"Saving audio to: {output_path}")
-        sf.write(str(output_path), final_audio, sample_rate)
+        save_timeline_audio(final_audio, sample_rate, output_path, output_format)
         print_success(f"Audio saved to: {output_path}")
 
         # Get file size for result display
@@ -1519,13 +1587,23 @@ def process_trans_voice(input_file, srt_file, source_lang, target_lang, output_d
 
     except Exception as e:
         print_error(f"Error during voice cloning translation: {e}")
-        import traceback
         traceback.print_exc()
         return 1
 
     return 0
 
 
+def positive_int(value):
+    """argparse type for options that must be an integer >= 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     """Main CLI entry point"""
     # Load environment variables from .env file
@@ -1653,6 +1731,23 @@ See http://localhost:8000/languages for full list of supported languages.
         help='Random seed for voice cloning reproducibility (default: random but fixed across one generation process, 0-1000000 for specific seed)'
     )
 
+    # Concurrent API requests
+    parser.add_argument(
+        '--workers',
+        type=positive_int,
+        default=4,
+        metavar='N',
+        help='Number of concurrent m4t API requests for subtitle translation and voice cloning (default: 4)'
+    )
+
+    # Output audio format
+    parser.add_argument(
+        '--output-format',
+        choices=sorted(OUTPUT_FORMATS),
+        default='pcm16',
+        help='WAV sample format for generated audio (default: pcm16; float32 doubles file size)'
+    )
+
     # Optional output directory
     parser.add_argument(
         '--output',
@@ -1670,6 +1765,10 @@ See http://localhost:8000/languages for full list of supported languages.
 
     args = parser.parse_args()
 
+    # Keep enough pooled connections for the worker threads plus the
+    # background audio split, so concurrent requests don't churn connections
+    configure_session_pool(max(DEFAULT_POOL_MAXSIZE, args.workers + AUDIO_SPLIT_WORKERS))
+
     # Auto-enable subtitle-source-lang when using subtitle-refiner
     if args.subtitle_refiner:
         args.subtitle_source_lang = True
@@ -1703,14 +1802,15 @@ See http://localhost:8000/languages for full list of supported languages.
                 target_lang=target_lang,
                 output_dir=args.output,
                 api_url=args.api_url,
-                seed=args.seed
+                seed=args.seed,
+                output_format=args.output_format,
+                workers=args.workers
             )
         except KeyboardInterrupt:
             print_error("\n\nInterrupted by user")
             return 130
         except Exception as e:
             print_error(f"\nUnexpected error: {e}")
-            import traceback
             traceback.print_exc()
             return 1
 
@@ -1745,14 +1845,15 @@ See http://localhost:8000/languages for full list of supported languages.
                 args.api_url,
                 args.speaker_id,
                 args.split,
-                args.subtitle_refiner
+                args.subtitle_refiner,
+                args.output_format,
+                args.workers
             )
         except KeyboardInterrupt:
             print_error("\n\nInterrupted by user")
             return 130
         except Exception as e:
             print_error(f"\nUnexpected error: {e}")
-            import traceback
             traceback.print_exc()
             return 1
 
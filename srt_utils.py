@@ -13,9 +13,17 @@ First subtitle text
 Second subtitle text
 """
 
-from typing import List, Dict
+from typing import List, Dict, Iterator
 import math
 import re
+import textwrap
+
+# Runs of spaces collapsed by clean_subtitle_text
+_MULTI_SPACE_RE = re.compile(r' +')
+
+# SRT timestamp ("HH:MM:SS,mmm") and timing line ("start --> end") patterns
+_TIMESTAMP_RE = re.compile(r'(\d+):(\d+):(\d+),(\d+)')
+_TIMING_LINE_RE = re.compile(r'(.+?)\s*-->\s*(.+)')
 
 
 def parse_srt_timestamp(timestamp: str) -> float:
@@ -35,7 +43,7 @@ def parse_srt_timestamp(timestamp: str) -> float:
         125.678
     """
     # Format: HH:MM:SS,mmm
-    match = re.match(r'(\d+):(\d+):(\d+),(\d+)', timestamp)
+    match = _TIMESTAMP_RE.match(timestamp)
     if not match:
         raise ValueError(f"Invalid SRT timestamp format: {timestamp}")
 
@@ -43,6 +51,70 @@ def parse_srt_timestamp(timestamp: str) -> float:
     return hours * 3600 + minutes * 60 + seconds + milliseconds / 1000.0
 
 
+def _parse_srt_entry(entry: str):
+    """Parse one blank-line separated SRT block, or return None if it is invalid"""
+    lines = entry.strip().split('\n')
+    if len(lines) < 3:
+        return None  # Invalid entry
+
+    try:
+        # Line 1: Index
+        index = int(lines[0].strip())
+
+        # Line 2: Timestamps
+        timestamp_line = lines[1].strip()
+        match = _TIMING_LINE_RE.match(timestamp_line)
+        if not match:
+            return None
+
+        start_ts, end_ts = match.groups()
+        start = parse_srt_timestamp(start_ts.strip())
+        end = parse_srt_timestamp(end_ts.strip())
+
+    except (ValueError, IndexError):
+        # Skip invalid entries
+        return None
+
+    # Lines 3+: Text (may be multiple lines for bilingual subtitles)
+    return {
+        'index': index,
+        'start': start,
+        'end': end,
+        'text': '\n'.join(lines[2:])
+    }
+
+
+def iter_srt_file(srt_path: str) -> Iterator[Dict]:
+    """
+    Parse SRT subtitle file lazily, yielding one entry at a time
+
+    Reads the file line by line, so only the current entry is held in memory.
+
+    Args:
+        srt_path: Path to SRT file
+
+    Yields:
+        Subtitle dicts with keys: index, start, end, text
+    """
+    with open(srt_path, 'r', encoding='utf-8') as f:
+        block = []
+        for line in f:
+            # Entries are separated by blank lines
+            if line == '\n':
+                if block:
+                    entry = _parse_srt_entry(''.join(block))
+                    if entry:
+                        yield entry
+                    block = []
+            else:
+                block.append(line)
+
+        if block:
+            entry = _parse_srt_entry(''.join(block))
+            if entry:
+                yield entry
+
+
 def parse_srt_file(srt_path: str) -> List[Dict]:
     """
     Parse SRT subtitle file
@@ -58,51 +130,7 @@ def parse_srt_file(srt_path: str) -> List[Dict]:
         subtitles = parse_srt_file("video.srt")
         # Each entry: {"index": 1, "start": 4.354, "end": 5.470, "text": "Target\\nSource"}
     """
-    subtitles = []
-
-    with open(srt_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Split by double newlines (entries are separated by blank lines)
-    entries = re.split(r'\n\n+', content.strip())
-
-    for entry in entries:
-        if not entry.strip():
-            continue
-
-        lines = entry.strip().split('\n')
-        if len(lines) < 3:
-            continue  # Invalid entry
-
-        try:
-            # Line 1: Index
-            index = int(lines[0].strip())
-
-            # Line 2: Timestamps
-            timestamp_line = lines[1].strip()
-            match = re.match(r'(.+?)\s*-->\s*(.+)', timestamp_line)
-            if not match:
-                continue
-
-            start_ts, end_ts = match.groups()
-            start = parse_srt_timestamp(start_ts.strip())
-            end = parse_srt_timestamp(end_ts.strip())
-
-            # Lines 3+: Text (may be multiple lines for bilingual subtitles)
-            text = '\n'.join(lines[2:])
-
-            subtitles.append({
-                'index': index,
-                'start': start,
-                'end': end,
-                'text': text
-            })
-
-        except (ValueError, IndexError) as e:
-            # Skip invalid entries
-            continue
-
-    return subtitles
+    return list(iter_srt_file(srt_path))
 
 
 def extract_bilingual_text(text: str) -> tuple:
@@ -118,7 +146,8 @@ def extract_bilingual_text(text: str) -> tuple:
         Tuple of (target_text, source_text)
         If only one line, returns (text, text)
     """
-    lines = text.strip().split('\n')
+    # Only the first two lines are used, so stop splitting after them
+    lines = text.strip().split('\n', 2)
 
     if len(lines) >= 2:
         return lines[0].strip(), lines[1].strip()
@@ -144,15 +173,14 @@ def format_srt_timestamp(seconds: float) -> str:
         >>> format_srt_timestamp(125.678)
         '00:02:05,678'
     """
-    # Handle negative values
-    if seconds < 0:
-        seconds = 0
+    # Convert once to integer milliseconds (negative values clamp to 0); rounding
+    # avoids float truncation turning e.g. 1.4 into ",399"
+    millisecs = 0 if seconds < 0 else round(seconds * 1000)
 
     # Calculate components
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millisecs = int((seconds % 1) * 1000)
+    secs, millisecs = divmod(millisecs, 1000)
+    minutes, secs = divmod(secs, 60)
+    hours, minutes = divmod(minutes, 60)
 
     # Format: HH:MM:SS,mmm
     return f"{hours:02d}:{minutes:02d}:{secs:02d},{millisecs:03d}"
@@ -176,7 +204,6 @@ def clean_subtitle_text(text: str, max_length: int = 80) -> str:
     text = text.strip()
 
     # Replace multiple spaces with single space, but preserve newlines
-    import re
     # Split by newlines first to preserve line structure (for bilingual subtitles)
     lines = text.split('\n')
     cleaned_lines = []
@@ -184,31 +211,15 @@ def clean_subtitle_text(text: str, max_length: int = 80) -> str:
     for line in lines:
         # For each line, replace multiple spaces with single space
         line = line.strip()
-        line = re.sub(r' +', ' ', line)
+        line = _MULTI_SPACE_RE.sub(' ', line)
 
-        # Optionally break long lines
+        # Optionally break long lines at word boundaries (long words are kept whole).
+        # Words are split on any Unicode whitespace (tabs, ideographic spaces, ...)
+        # and rejoined with single spaces before wrapping
         if len(line) > max_length:
-            # Try to break at natural points
-            words = line.split()
-            sub_lines = []
-            current_line = []
-            current_length = 0
-
-            for word in words:
-                word_len = len(word) + (1 if current_line else 0)
-                if current_length + word_len <= max_length:
-                    current_line.append(word)
-                    current_length += word_len
-                else:
-                    if current_line:
-                        sub_lines.append(' '.join(current_line))
-                    current_line = [word]
-                    current_length = len(word)
-
-            if current_line:
-                sub_lines.append(' '.join(current_line))
-
-            cleaned_lines.extend(sub_lines)
+            cleaned_lines.extend(textwrap.wrap(
+                ' '.join(line.split()), max_length, break_long_words=False, break_on_hyphens=False
+            ))
         else:
             cleaned_lines.append(line)
 
@@ -235,36 +246,45 @@ def merge_short_subtitles(
         return []
 
     merged = []
+    # Pending merge as [first_sub, end, text_parts]; the merged dict is only
+    # built on flush, so runs of short subtitles join their text once
     buffer = None
 
+    def flush(buffer):
+        first, end, parts = buffer
+        if len(parts) == 1:
+            merged.append(first)
+        else:
+            merged.append({**first, 'end': end, 'text': ' '.join(parts)})
+
     for sub in subtitles:
         duration = sub['end'] - sub['start']
 
         if duration < min_duration:
             if buffer is None:
                 # Start buffering
-                buffer = sub.copy()
+                buffer = [sub, sub['end'], [sub['text']]]
             else:
                 # Merge with buffer
-                merged_duration = sub['end'] - buffer['start']
+                merged_duration = sub['end'] - buffer[0]['start']
                 if merged_duration <= max_duration:
-                    buffer['end'] = sub['end']
-                    buffer['text'] += ' ' + sub['text']
+                    buffer[1] = sub['end']
+                    buffer[2].append(sub['text'])
                 else:
                     # Buffer is full, flush it
-                    merged.append(buffer)
-                    buffer = sub.copy()
+                    flush(buffer)
+                    buffer = [sub, sub['end'], [sub['text']]]
         else:
             # Normal duration subtitle
-            if buffer:
+            if buffer is not None:
                 # Flush buffer first
-                merged.append(buffer)
+                flush(buffer)
                 buffer = None
             merged.append(sub)
 
     # Flush remaining buffer
-    if buffer:
-        merged.append(buffer)
+    if buffer is not None:
+        flush(buffer)
 
     return merged
 
@@ -289,7 +309,29 @@ def generate_srt_entry(index: int, start: float, end: float, text: str) -> str:
     return f"{index}\n{start_ts} --> {end_ts}\n{cleaned_text}\n"
 
 
-def generate_srt_content(subtitles: List[Dict], merge_short: bool = True) -> str:
+def _iter_srt_entries(subtitles: List[Dict], merge_short: bool, already_sorted: bool):
+    """Yield formatted SRT entries in output order (shared by content and file writers)"""
+    # Sort by start time (merging below relies on chronological order)
+    sorted_subs = subtitles if already_sorted else sorted(subtitles, key=lambda x: x['start'])
+
+    # Optionally merge short subtitles
+    if merge_short:
+        sorted_subs = merge_short_subtitles(sorted_subs)
+
+    for i, sub in enumerate(sorted_subs, start=1):
+        yield generate_srt_entry(
+            index=sub.get('index', i),
+            start=sub['start'],
+            end=sub['end'],
+            text=sub.get('text', '')
+        )
+
+
+def generate_srt_content(
+    subtitles: List[Dict],
+    merge_short: bool = True,
+    already_sorted: bool = False
+) -> str:
     """
     Generate complete SRT file content from subtitle list
 
@@ -297,6 +339,8 @@ def generate_srt_content(subtitles: List[Dict], merge_short: bool = True) -> str
         subtitles: List of dicts with keys: start, end, text
                    Optional: index (will be generated if missing)
         merge_short: Whether to merge very short subtitles
+        already_sorted: Skip sorting when subtitles are known to be in start-time
+                        order (e.g. built from a timeline)
 
     Returns:
         Complete SRT file content as string
@@ -311,26 +355,43 @@ def generate_srt_content(subtitles: List[Dict], merge_short: bool = True) -> str
     if not subtitles:
         return ""
 
-    # Optionally merge short subtitles
-    if merge_short:
-        subtitles = merge_short_subtitles(subtitles)
+    # Join with blank lines between entries
+    return '\n'.join(_iter_srt_entries(subtitles, merge_short, already_sorted))
 
-    # Sort by start time
-    sorted_subs = sorted(subtitles, key=lambda x: x['start'])
 
-    # Generate SRT entries
-    entries = []
-    for i, sub in enumerate(sorted_subs, start=1):
-        entry = generate_srt_entry(
-            index=sub.get('index', i),
-            start=sub['start'],
-            end=sub['end'],
-            text=sub.get('text', '')
-        )
-        entries.append(entry)
+def generate_srt_to_file(
+    subtitles: List[Dict],
+    output_path: str,
+    merge_short: bool = True,
+    already_sorted: bool = False
+) -> bool:
+    """
+    Generate SRT file from subtitle list, writing entries directly to disk
 
-    # Join with blank lines between entries
-    return '\n'.join(entries)
+    Produces the same file as generate_srt_content + save_srt_file without
+    holding the whole file content in memory.
+
+    Args:
+        subtitles: List of dicts with keys: start, end, text
+        output_path: Path to save SRT file
+        merge_short: Whether to merge very short subtitles
+        already_sorted: Skip sorting when subtitles are already in start-time order
+
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        entries = _iter_srt_entries(subtitles, merge_short, already_sorted)
+        first = next(entries, None)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            if first is not None:
+                f.write(first)
+                # Blank line between entries
+                f.writelines('\n' + entry for entry in entries)
+        return True
+    except Exception as e:
+        print(f"Error saving SRT file: {e}")
+        return False
 
 
 def save_srt_file(srt_content: str, output_path: str) -> bool:
@@ -364,6 +425,7 @@ def validate_subtitle_timing(subtitles: List[Dict]) -> List[str]:
         List of error messages (empty if no issues)
     """
     issues = []
+    timed = []  # (start, end, index) for the overlap sweep
 
     for i, sub in enumerate(subtitles):
         # Check required fields
@@ -382,13 +444,17 @@ def validate_subtitle_timing(subtitles: List[Dict]) -> List[str]:
                 issues.append(f"Subtitle {i}: Negative end time ({sub['end']})")
             if sub['end'] <= sub['start']:
                 issues.append(f"Subtitle {i}: End time ({sub['end']}) must be after start time ({sub['start']})")
-
-        # Check for overlaps with next subtitle
-        if i < len(subtitles) - 1:
-            next_sub = subtitles[i + 1]
-            if 'start' in next_sub and 'end' in sub:
-                if next_sub['start'] < sub['end']:
-                    issues.append(f"Subtitle {i} and {i+1}: Timing overlap detected")
+            timed.append((sub['start'], sub['end'], i))
+
+    # Check for overlaps in one sweep over start-sorted subtitles, tracking the
+    # latest end seen so far (input order is not assumed to be chronological)
+    timed.sort()
+    prev_end, prev_index = None, None
+    for start, end, i in timed:
+        if prev_end is not None and start < prev_end:
+            issues.append(f"Subtitle {prev_index} and {i}: Timing overlap detected")
+        if prev_end is None or end > prev_end:
+            prev_end, prev_index = end, i
 
     return issues
 